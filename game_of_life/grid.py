@@ -6,10 +6,7 @@ import itertools
 import random
 import typing
 
-import pyglet
-
 from .cell import Cell
-from .constants import FOREGROUND, SIMULATION_TICK
 
 try:
     from .cython_modules.neighbor_search import get_neighbor_indices as get_neighbor_indices_optimized
@@ -40,35 +37,34 @@ except ImportError:
 
 
 class Grid:
-    """Grid of `Cell`s."""
+    """
+    Grid of `Cell`s.
+
+    Callables added with `add_observer` are called with every batch of cells switched through `switch_cells`.
+    """
 
     def __init__(
             self,
             x: int,
             y: int,
-            cell_size: int,
             start_grid: typing.Optional[list[list[int]]],
             *,
-            height: typing.Optional[int] = None,
-            width: typing.Optional[int] = None,
-            batch: pyglet.graphics.Batch,
-            group: pyglet.graphics.Group,
+            row_count: typing.Optional[int] = None,
+            col_count: typing.Optional[int] = None,
     ):
         self.cells: list[Cell] = []
-        self.cell_size = cell_size
         if start_grid:
             self.row_count = len(start_grid)
             self.col_count = len(start_grid[0])
         else:
-            self.row_count = height // cell_size
-            self.col_count = width // cell_size
-        self.x = x // cell_size
-        self.y = y // cell_size
-        self.grid_lines = []
-        self.batch = batch
-        self.create(start_grid, group)
-
-    def create(self, start_grid: list[list[int]], group: pyglet.graphics.Group) -> None:
+            self.row_count = row_count
+            self.col_count = col_count
+        self.x = x
+        self.y = y
+        self.observers: list[typing.Callable[[typing.Sequence[Cell]], None]] = []
+        self.create(start_grid)
+
+    def create(self, start_grid: typing.Optional[list[list[int]]]) -> None:
         """
         Init cell objects for whole grid.
 
@@ -76,50 +72,26 @@ class Grid:
         """
         if start_grid is None:
             for y, x in itertools.product(range(self.row_count), range(self.col_count)):
-                cell = Cell(self.cell_size, self.x + x, self.y + y, self.batch, group)
-                self.cells.append(cell)
-                if random.random() < .33:
-                    cell.switch()
+                self.cells.append(Cell(self.x + x, self.y + y, random.random() < .33))
         else:
             for y, row in enumerate(start_grid):
                 for x, state in enumerate(row):
-                    cell = Cell(self.cell_size, self.x + x, self.y + y, self.batch, group)
-                    self.cells.append(cell)
-                    if state:
-                        cell.switch()
-
-    def create_grid(self) -> None:
-        """Create grid from lines."""
-        pyglet.gl.glLineWidth(1)
-        for y in range(self.row_count + 1):
-            self.grid_lines.append(
-                self.batch.add(
-                    2, pyglet.gl.GL_LINES, FOREGROUND,
-                    (
-                        "v2i/static",
-                        (
-                            self.x * self.cell_size, (self.y + y) * self.cell_size,
-                            (self.x + self.col_count) * self.cell_size, (self.y + y) * self.cell_size,
-                        ),
-                    ),
-                    ("c3B", (180,) * 3 * 2)
-                )
-            )
-        for x in range(self.col_count + 1):
-            self.grid_lines.append(
-                self.batch.add(
-                    2, pyglet.gl.GL_LINES, FOREGROUND,
-                    (
-                        "v2i/static",
-                        (
-                            (self.x + x) * self.cell_size, self.y * self.cell_size,
-                            (self.x + x) * self.cell_size, (self.y + self.row_count) * self.cell_size,
-                        )
-                    ),
-                    ("c3B", (180,) * 3 * 2)
-
-                )
-            )
+                    self.cells.append(Cell(self.x + x, self.y + y, bool(state)))
+
+    def add_observer(self, observer: typing.Callable[[typing.Sequence[Cell]], None]) -> None:
+        """Call `observer` with the switched cells whenever cells are switched."""
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: typing.Callable[[typing.Sequence[Cell]], None]) -> None:
+        """Stop calling `observer` on switches."""
+        self.observers.remove(observer)
+
+    def switch_cells(self, cells: typing.Sequence[Cell]) -> None:
+        """Switch the state of all `cells` and notify the observers."""
+        for cell in cells:
+            cell.switch()
+        for observer in self.observers:
+            observer(cells)
 
     def move_grid(self, x_target: int, y_target: int) -> None:
         """Move self to x_target, y_target."""
@@ -146,12 +118,9 @@ class Grid:
 class GameOfLife:
     """Manages grid of `Cell`s and simulates the game of life with them."""
 
-    def __init__(self, grid: Grid, *, tick: float = SIMULATION_TICK):
+    def __init__(self, grid: Grid):
         self.grid = grid
-        self.grid.create_grid()
         self.changed: typing.Union[set[Cell]] = set(self.grid.cells)
-        self.running = True
-        pyglet.clock.schedule_interval(self.run_generation, tick)
 
     def run_generation(self, _dt: typing.Optional[float] = None) -> None:
         """Run a single generation."""
@@ -166,14 +135,13 @@ class GameOfLife:
                     changed.update(neighbors)
 
             self.changed = changed
-            for cell in cells_to_update:
-                cell.switch()
+            self.grid.switch_cells(cells_to_update)
 
     def switch_cell_at(self, col: int, row: int) -> None:
         """Switch the state of the cell at col, row."""
         cell = self.grid.get_cell_at(col, row)
         self.changed.update(self.get_cell_neighbors(cell))
-        cell.switch()
+        self.grid.switch_cells((cell,))
 
     def set_cell_state_at(self, col: int, row: int, state: bool) -> None:
         """
@@ -184,23 +152,13 @@ class GameOfLife:
         cell = self.grid.get_cell_at(col, row)
         if cell.is_alive is not state:
             self.changed.update(self.get_cell_neighbors(cell))
-            cell.switch()
+            self.grid.switch_cells((cell,))
 
     @functools.cache
     def get_cell_neighbors(self, cell: Cell) -> typing.Iterator[Cell]:
         """Yield `cell` and all of its neighbors."""
         return tuple(self.grid.cells[index] for index in self.grid.get_neighbor_indices(cell.x, cell.y))
 
-    def start_stop(self, tick: float = SIMULATION_TICK) -> None:
-        """Stop the game if it is running, stop it otherwise."""
-        if self.running:
-            pyglet.clock.unschedule(self.run_generation)
-        else:
-            pyglet.clock.schedule_interval(self.run_generation, tick)
-        self.running = not self.running
-
     def clear(self) -> None:
         """Kill all cells."""
-        for cell in self.grid.cells:
-            if cell.is_alive:
-                cell.switch()
+        self.grid.switch_cells([cell for cell in self.grid.cells if cell.is_alive])
@@ -0,0 +1,153 @@
+# This file is part of Game-of-life.
+# Copyright (C) 2021  Numerlor
+
+import functools
+import typing
+
+import numpy as np
+
+from .cell import Cell
+from .grid import Grid
+
+
+def _wrapped_neighbor_indices(offset: int, row_count: int, col_count: int) -> np.ndarray:
+    """
+    Get the indices of the 8 neighbors of every cell in a universe of row_count x col_count.
+
+    Neighbors wrap around the universe's own edges; `offset` is added to the indices
+    to place them into the universe's slice of the stacked state array.
+    """
+    rows = np.arange(row_count).reshape(-1, 1)
+    cols = np.arange(col_count).reshape(1, -1)
+    neighbors = [
+        ((rows + dy) % row_count) * col_count + (cols + dx) % col_count
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+        if dx or dy
+    ]
+    return np.stack(neighbors, axis=-1).reshape(-1, 8) + offset
+
+
+class Multiverse:
+    """
+    Simulates many independent universes of different sizes at once.
+
+    The states of all universes are packed row by row into a single flat array,
+    together with a table of every cell's 8 neighbor indices which wrap around the edges of its own universe.
+    A generation for all universes is then computed with a single vectorized gather and sum.
+
+    Added universes are kept in pending chunks which are only concatenated into the packed arrays
+    when they're next needed, so adding many universes doesn't copy the arrays for each of them.
+    """
+
+    def __init__(self):
+        self._states = np.zeros(0, dtype=np.uint8)
+        self.offsets: list[int] = [0]
+        self._neighbors = np.empty((0, 8), dtype=np.intp)
+        self._pending_states: list[np.ndarray] = []
+        self._pending_neighbors: list[np.ndarray] = []
+
+    def add_universe(self, grid: list[list[int]]) -> None:
+        """Add a universe with the initial state from grid."""
+        row_count = len(grid)
+        col_count = len(grid[0])
+        offset = self.offsets[-1]
+        self._pending_states.append(np.asarray(grid, dtype=bool).astype(np.uint8).reshape(-1))
+        self._pending_neighbors.append(_wrapped_neighbor_indices(offset, row_count, col_count))
+        self.offsets.append(offset + row_count * col_count)
+
+    @property
+    def states(self) -> np.ndarray:
+        """The flat state array of all universes."""
+        self._flush_pending()
+        return self._states
+
+    def _flush_pending(self) -> None:
+        """Concatenate the pending universes into the packed arrays."""
+        if self._pending_states:
+            self._states = np.concatenate((self._states, *self._pending_states))
+            self._neighbors = np.concatenate((self._neighbors, *self._pending_neighbors))
+            self._pending_states.clear()
+            self._pending_neighbors.clear()
+
+    def run_generation(self) -> np.ndarray:
+        """Run a single generation of all universes and return the flat indices of the cells that switched."""
+        states = self.states
+        alive_neighbors = states[self._neighbors].sum(axis=1, dtype=np.uint8)
+        new_states = ((alive_neighbors == 3) | (states.astype(bool) & (alive_neighbors == 2))).astype(np.uint8)
+        switched = np.flatnonzero(new_states != states)
+        self._states = new_states
+        return switched
+
+    def locate(self, flat_indices: np.ndarray) -> np.ndarray:
+        """Get the index of the universe each of the flat state indices belongs to."""
+        return np.searchsorted(self.offsets, flat_indices, side="right") - 1
+
+    def clear(self) -> None:
+        """Remove all universes."""
+        self._states = np.zeros(0, dtype=np.uint8)
+        self.offsets = [0]
+        self._neighbors = np.empty((0, 8), dtype=np.intp)
+        self._pending_states.clear()
+        self._pending_neighbors.clear()
+
+
+class BatchedGameOfLife:
+    """
+    Simulates the game of life on many `Grid`s at once.
+
+    The grids' states are held by a single `Multiverse` which is advanced in one vectorized call per generation,
+    the switched cells are then passed to each grid's `switch_cells` in a single batch.
+
+    Cells switched on an added grid from outside of the simulation are written back into the multiverse.
+    """
+
+    def __init__(self):
+        self.multiverse = Multiverse()
+        self.grids: list[Grid] = []
+        self._observers: list[typing.Callable[[typing.Sequence[Cell]], None]] = []
+        self._switching = False
+
+    def add_grid(self, grid: Grid) -> None:
+        """Add grid to the multiverse and start observing its switches."""
+        offset = self.multiverse.offsets[-1]
+        self.multiverse.add_universe([
+            [cell.is_alive for cell in grid.cells[y*grid.col_count:(y+1)*grid.col_count]]
+            for y in range(grid.row_count)
+        ])
+        observer = functools.partial(self._on_external_switch, grid, offset)
+        grid.add_observer(observer)
+        self.grids.append(grid)
+        self._observers.append(observer)
+
+    def _on_external_switch(self, grid: Grid, offset: int, cells: typing.Sequence[Cell]) -> None:
+        """Write the states of `cells` switched outside of `run_generation` into the multiverse."""
+        if self._switching:
+            return
+        states = self.multiverse.states
+        for cell in cells:
+            states[offset + (cell.y - grid.y) * grid.col_count + cell.x - grid.x] = cell.is_alive
+
+    def run_generation(self, _dt: typing.Optional[float] = None) -> None:
+        """Run a single generation on all grids."""
+        switched = self.multiverse.run_generation()
+        # switched is sorted, so each universe's switches are a contiguous run starting at its first index
+        universes, starts = np.unique(self.multiverse.locate(switched), return_index=True)
+        switched = switched.tolist()
+        ends = [*starts[1:].tolist(), len(switched)]
+        self._switching = True
+        try:
+            for universe, start, end in zip(universes.tolist(), starts.tolist(), ends):
+                grid = self.grids[universe]
+                offset = self.multiverse.offsets[universe]
+                grid.switch_cells([grid.cells[index - offset] for index in switched[start:end]])
+        finally:
+            self._switching = False
+
+    def clear(self) -> None:
+        """Remove all grids and stop observing them."""
+        for grid, observer in zip(self.grids, self._observers):
+            grid.remove_observer(observer)
+        self.multiverse.clear()
+        self.grids.clear()
+        self._observers.clear()
@@ -0,0 +1,93 @@
+# This file is part of Game-of-life.
+# Copyright (C) 2021  Numerlor
+
+import typing
+
+import pyglet
+
+from .cell import Cell
+from .grid import Grid
+
+BACKGROUND = pyglet.graphics.OrderedGroup(0)
+MIDDLEGROUND = pyglet.graphics.OrderedGroup(1)
+FOREGROUND = pyglet.graphics.OrderedGroup(2)
+
+
+class GridRenderer:
+    """
+    Draws a `Grid`'s cells as rectangles.
+
+    The renderer observes the grid and recolors the rectangles of every batch of cells the grid switches.
+    """
+
+    def __init__(self, grid: Grid, cell_size: int, *, batch: pyglet.graphics.Batch, group: pyglet.graphics.Group):
+        self.grid = grid
+        self.cell_size = cell_size
+        self.batch = batch
+        self.grid_lines = []
+        self.rects: dict[Cell, pyglet.shapes.Rectangle] = {
+            cell: pyglet.shapes.Rectangle(
+                cell.x*cell_size, cell.y*cell_size, cell_size, cell_size, self.cell_color(cell), batch, group=group
+            )
+            for cell in grid.cells
+        }
+        grid.add_observer(self.on_switch)
+
+    @staticmethod
+    def cell_color(cell: Cell) -> tuple[int, int, int]:
+        """Get the color of the rectangle for `cell`."""
+        return (0,)*3 if cell.is_alive else (255,)*3
+
+    def on_switch(self, cells: typing.Sequence[Cell]) -> None:
+        """Recolor the rectangles of the switched cells."""
+        for cell in cells:
+            self.rects[cell].color = self.cell_color(cell)
+
+    def create_grid(self) -> None:
+        """Create grid from lines."""
+        pyglet.gl.glLineWidth(1)
+        grid = self.grid
+        for y in range(grid.row_count + 1):
+            self.grid_lines.append(
+                self.batch.add(
+                    2, pyglet.gl.GL_LINES, FOREGROUND,
+                    (
+                        "v2i/static",
+                        (
+                            grid.x * self.cell_size, (grid.y + y) * self.cell_size,
+                            (grid.x + grid.col_count) * self.cell_size, (grid.y + y) * self.cell_size,
+                        ),
+                    ),
+                    ("c3B", (180,) * 3 * 2)
+                )
+            )
+        for x in range(grid.col_count + 1):
+            self.grid_lines.append(
+                self.batch.add(
+                    2, pyglet.gl.GL_LINES, FOREGROUND,
+                    (
+                        "v2i/static",
+                        (
+                            (grid.x + x) * self.cell_size, grid.y * self.cell_size,
+                            (grid.x + x) * self.cell_size, (grid.y + grid.row_count) * self.cell_size,
+                        )
+                    ),
+                    ("c3B", (180,) * 3 * 2)
+
+                )
+            )
+
+    def move_grid(self, x_target: int, y_target: int) -> None:
+        """Move the grid and its rectangles to x_target, y_target."""
+        self.grid.move_grid(x_target, y_target)
+        for cell, rect in self.rects.items():
+            rect.x = cell.x * self.cell_size
+            rect.y = cell.y * self.cell_size
+
+    def delete(self) -> None:
+        """Stop observing the grid and delete all opengl vertices."""
+        self.grid.remove_observer(self.on_switch)
+        for rect in self.rects.values():
+            rect.delete()
+        for line in self.grid_lines:
+            line.delete()
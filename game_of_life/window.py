@@ -7,7 +7,9 @@ from pathlib import Path
 import pyglet
 
 from .grid import GameOfLife, Grid
-from .constants import BACKGROUND, CELL_SIZE, FOREGROUND, HEIGHT, MIDDLEGROUND, WIDTH
+from .constants import CELL_SIZE, HEIGHT, SIMULATION_TICK, WIDTH
+from .multiverse import BatchedGameOfLife
+from .render import BACKGROUND, FOREGROUND, GridRenderer, MIDDLEGROUND
 from .utils import load_grids_from_file, pad_grid
 
 MAX_PAGE = 2
@@ -60,11 +62,15 @@ class GameOfLifeWindow(pyglet.window.Window):
             width = WIDTH
         super().__init__(width, height, *args, **kwargs)
         self.batch = pyglet.graphics.Batch()
-        grid = Grid(0, 0, CELL_SIZE, start_grid, height=height, width=width, batch=self.batch, group=BACKGROUND)
+        grid = Grid(0, 0, start_grid, row_count=height // CELL_SIZE, col_count=width // CELL_SIZE)
+        self.renderer = GridRenderer(grid, CELL_SIZE, batch=self.batch, group=BACKGROUND)
+        self.renderer.create_grid()
         self.game = GameOfLife(grid)
+        self.running = True
+        pyglet.clock.schedule_interval(self.game.run_generation, SIMULATION_TICK)
         self.context_menu = None
         self.template = None
-        self.grid = None
+        self.template_renderer = None
 
     def on_draw(self) -> None:
         """Clear window and draw grid's batch."""
@@ -76,7 +82,7 @@ class GameOfLifeWindow(pyglet.window.Window):
         if symbol == pyglet.window.key.SPACE:
             self.game.run_generation(0)
         elif symbol == pyglet.window.key.P:
-            self.game.start_stop()
+            self.start_stop()
 
     def on_mouse_press(self, x: int, y: int, button: int, modifiers: int) -> None:
         """
@@ -88,7 +94,7 @@ class GameOfLifeWindow(pyglet.window.Window):
             * if no context menu is open switch the cell under the cursor
             * reset the context menu instance to None
 
-            * if a template is active, set the cells under it to its state and reset the tempalte and grid
+            * if a template is active, set the cells under it to its state and reset the tempalte and its renderer
         """
         if button == pyglet.window.mouse.RIGHT:
             self.construct_context_menu(x, y)
@@ -97,18 +103,17 @@ class GameOfLifeWindow(pyglet.window.Window):
                 self.game.switch_cell_at(x // CELL_SIZE, y // CELL_SIZE)
             self.context_menu = None
             if self.template:
-                for cell in self.grid.cells:
-                    cell.delete()
+                self.template_renderer.delete()
                 for cell_y, row in enumerate(self.template):
                     for cell_x, state in enumerate(row):
                         self.game.set_cell_state_at(x // CELL_SIZE + cell_x, y // CELL_SIZE + cell_y, bool(state))
                 self.template = None
-                self.grid = None
+                self.template_renderer = None
 
     def on_mouse_motion(self, x: int, y: int, dx: int, dy: int) -> None:
         """If we have an active template, keep the grid at the mouse's position."""
         if self.template is not None:
-            self.grid.move_grid(x // CELL_SIZE, y // CELL_SIZE)
+            self.template_renderer.move_grid(x // CELL_SIZE, y // CELL_SIZE)
 
     def on_mouse_drag(self, x: int, y: int, dx: int, dy: int, buttons: int, modifiers: int) -> None:
         """When the mouse is dragged, fill cells. If ctrl is held the cells are killed instead."""
@@ -118,23 +123,33 @@ class GameOfLifeWindow(pyglet.window.Window):
     def set_grid(self, grid: list[list[int]]) -> None:
         """Set the template to the received grid."""
         self.template = grid
-        self.grid = Grid(0, 0, CELL_SIZE, self.template, batch=self.batch, group=MIDDLEGROUND)
+        self.template_renderer = GridRenderer(
+            Grid(0, 0, self.template), CELL_SIZE, batch=self.batch, group=MIDDLEGROUND
+        )
+
+    def start_stop(self, tick: float = SIMULATION_TICK) -> None:
+        """Stop the game if it is running, stop it otherwise."""
+        if self.running:
+            pyglet.clock.unschedule(self.game.run_generation)
+        else:
+            pyglet.clock.schedule_interval(self.game.run_generation, tick)
+        self.running = not self.running
 
     def show_popup(self) -> None:
         """Show the template selection popup; stop the game if it's running."""
         pyglet.clock.unschedule(self.game.run_generation)
         SelectionPopup(self.set_grid)
-        self.game.running = False
+        self.running = False
 
     def construct_context_menu(self, x: int, y: int) -> None:
         """Create a context menu."""
         self.context_menu = ContextMenu(self, x, y, self.batch)
-        image = "stop" if self.game.running else "start"
+        image = "stop" if self.running else "start"
         self.context_menu.add_button(
             f"{image}_depressed.png",
             f"{image}_depressed.png",
             f"{image}_hover.png",
-            handler=self.game.start_stop
+            handler=self.start_stop
         )
         self.context_menu.add_button(
             "templates_depressed.png",
@@ -154,8 +169,8 @@ class TemplateWidget(pyglet.gui.WidgetBase):
     """
     Widget holding a grid template.
 
-    If static is True, the grid template is a Grid instance, otherwise
-    a GameOfLife instance is used and ran.
+    If static is True, the grid template is only drawn, otherwise
+    the grid is added to the `BatchedGameOfLife` instance and ran by it.
 
     When the mouse is pressed inside the widget, the widget calls its callback with the grid.
     """
@@ -171,7 +186,8 @@ class TemplateWidget(pyglet.gui.WidgetBase):
             *,
             static: bool,
             batch: pyglet.graphics.Batch,
-            callback: typing.Callable
+            callback: typing.Callable,
+            game: BatchedGameOfLife,
     ):
         super().__init__(x, y, width, height)
         self.template = template
@@ -182,17 +198,11 @@ class TemplateWidget(pyglet.gui.WidgetBase):
         grid_width = len(template[0]) * 5
         grid_height = len(template)*5
 
-        self.grid = Grid(
-                x+width//2-grid_width//2,
-                y+height//2-grid_height//2,
-                5,
-                template,
-                batch=batch,
-                group=MIDDLEGROUND
-        )
-        self.grid.create_grid()
+        grid = Grid((x+width//2-grid_width//2) // 5, (y+height//2-grid_height//2) // 5, template)
+        self.renderer = GridRenderer(grid, 5, batch=batch, group=MIDDLEGROUND)
+        self.renderer.create_grid()
         if not static:
-            self.game = GameOfLife(self.grid, tick=1/10)
+            game.add_grid(grid)
         self.name = name.title() if not name.isupper() else name
         self.label = pyglet.text.Label(self.name, x=x+width//2, y=y-20, width=width, batch=batch, anchor_x="center")
         self.construct_outline(x, y, width, height, batch)
@@ -215,18 +225,8 @@ class TemplateWidget(pyglet.gui.WidgetBase):
             )
 
     def destroy(self) -> None:
-        """Stop running game and delete all opengl vertices."""
-        if not self.static:
-            pyglet.clock.unschedule(self.game.run_generation)
-            for cell in self.game.grid.cells:
-                cell.delete()
-            for line in self.game.grid.grid_lines:
-                line.delete()
-        else:
-            for cell in self.grid.cells:
-                cell.delete()
-            for line in self.grid.grid_lines:
-                line.delete()
+        """Delete all opengl vertices."""
+        self.renderer.delete()
         for line in self.grid_lines:
             line.delete()
         self.label.delete()
@@ -251,6 +251,7 @@ class SelectionPopup(pyglet.window.Window):
 
         self.callback = pattern_callback
         self.current_page = 1
+        self.game = BatchedGameOfLife()
         self.add_buttons()
         self.widgets = []
         self.load_page()
@@ -295,7 +296,7 @@ class SelectionPopup(pyglet.window.Window):
 
         First all the previous templates widgets are destroyed,
         then all templates are searched and the ones matching the current page
-        number are displayed.
+        number are displayed. The page's non static templates are then ran if there are any.
         """
         self.destroy_widgets()
         y = self.height
@@ -317,11 +318,14 @@ class SelectionPopup(pyglet.window.Window):
                     name,
                     static=grids_data["STATIC"],
                     batch=self.batch,
-                    callback=self.callback
+                    callback=self.callback,
+                    game=self.game,
                 )
                 self.frame.add_widget(grid_widget)
                 self.widgets.append(grid_widget)
                 x += width
+        if self.game.grids:
+            pyglet.clock.schedule_interval(self.game.run_generation, 1/10)
 
     def on_mouse_press(self, x: int, y: int, button: int, modifiers: int) -> None:
         """If the click was in a template widget, close the window."""
@@ -329,16 +333,17 @@ class SelectionPopup(pyglet.window.Window):
             self.close()
 
     def destroy_widgets(self) -> None: # noqa D102
+        pyglet.clock.unschedule(self.game.run_generation)
+        self.game.clear()
         for widget in self.widgets:
             widget.destroy()
         self.widgets.clear()
         self.frame = pyglet.gui.Frame(self, cell_size=1)
 
-    def on_close(self) -> None:
+    def close(self) -> None:
         """When the window is closed destroy all widgets."""
         self.destroy_widgets()
-        self.widgets.clear()
-        super().on_close()
+        super().close()
 
     def on_draw(self): # noqa D102
         pyglet.gl.glClearColor(44/255, 47/255, 51/255, 1)